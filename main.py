@@ -6,29 +6,187 @@ Creates and signs Bitcoin testnet transactions with OP_RETURN outputs
 
 import os
 import sys
+import json
+import math
 import argparse
+import base64
+import binascii
+import contextlib
+import hashlib
+import secrets
+import struct
+import queue
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     RequestException,
     ConnectionError as RequestsConnectionError,
+    JSONDecodeError as RequestsJSONDecodeError,
 )
-from typing import Optional, Tuple, List, Dict
-from embit import script, ec
+from typing import Optional, Tuple, List, Dict, Iterator, TextIO
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+from urllib3.util import Retry
+from embit import bech32, ec, hashes, script
 from embit.networks import NETWORKS
-from embit.transaction import Transaction, TransactionInput, TransactionOutput
-from embit.psbt import PSBT
-from embit.finalizer import finalize_psbt
+from embit.transaction import (
+    SIGHASH,
+    Transaction,
+    TransactionInput,
+    TransactionOutput,
+)
+
+try:
+    # Optional: direct libsecp256k1 bindings for signing and key derivation
+    import coincurve  # ty: ignore[unresolved-import]
+except ImportError:
+    coincurve = None
+
+try:
+    # Optional: faster JSON parsing for large API/RPC responses
+    import orjson  # ty: ignore[unresolved-import]
+except ImportError:
+    orjson = None
+
+
+# Per-user cache for data that can be reused across runs
+CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "bitcoin-ops"
+)
+
+# ECDSA backends: embit's bundled secp256k1 bindings or coincurve's
+# libsecp256k1; "auto" uses coincurve when it's installed
+SIGN_BACKENDS = ("auto", "embit", "coincurve")
+
+# Seconds a fetched UTXO list is reused by later runs (see --utxo-cache-ttl)
+UTXO_CACHE_TTL = 30
+
+# Seconds to wait for an RPC connection; the per-call timeout covers the read
+RPC_CONNECT_TIMEOUT = 5
+
+# bitcoind rejects HTTP request bodies over 32 MB; stay clear of that limit
+RPC_MAX_BODY_SIZE = 30 * 1024 * 1024
+
+# Most requests in flight at once; sizes both the worker pools and the HTTP
+# connection pool so concurrent lookups never wait on or discard a socket
+MAX_CONCURRENT_REQUESTS = 16
+
+# Banner lines used to frame console sections
+_SEP = "=" * 80
+_SEP_DASH = "-" * 80
+
+# Smallest change output worth creating, in sats; anything less goes to fees
+DUST_LIMIT = 546
+
+# Serialized sizes, in bytes, of the parts of the one-input P2WPKH
+# transactions we build. Version + locktime, an outpoint with an empty
+# scriptSig and sequence, and a change output (value, length, 22-byte script)
+_TX_VERSION_LOCKTIME_BYTES = 4 + 4
+_P2WPKH_INPUT_BYTES = 32 + 4 + 1 + 4
+_P2WPKH_OUTPUT_BYTES = 8 + 1 + 22
+# Marker and flag, item count, then the pushed signature (at most 72 bytes of
+# DER plus the sighash byte) and compressed public key; witness bytes weigh 1
+_P2WPKH_WITNESS_BYTES = 2 + 1 + (1 + 73) + (1 + 33)
+
+# Watch-only descriptor wallet used by --rpc-only to track our address
+WATCH_WALLET_NAME = "bitcoin-ops-watch"
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize a request body compactly, using orjson when available"""
+    if orjson is None:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    return orjson.dumps(obj)
+
+
+def _parse_json(response: requests.Response):
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Match response.json() so callers catching RequestException still work
+        raise RequestsJSONDecodeError(e.msg, e.doc, e.pos, response=response)
+
+
+@dataclass(slots=True, frozen=True)
+class NetworkSettings:
+    """Everything that differs between the networks the CLI supports"""
+
+    name: str
+    label: str
+    params: Dict  # embit network parameters (WIF prefix, bech32 HRP, ...)
+    explorer_base: str
+    rpc_port: int
+    faucets: Tuple[str, ...] = ()
+
+    @property
+    def is_mainnet(self) -> bool:
+        return self.name == "main"
+
+
+# One shared instance per network, so every manager agrees on its parameters
+NETWORK_SETTINGS = {
+    "test": NetworkSettings(
+        "test",
+        "Testnet",
+        NETWORKS["test"],
+        "https://mempool.space/testnet",
+        18332,
+        ("https://testnet-faucet.mempool.co/", "https://coinfaucet.eu/en/btc-testnet/"),
+    ),
+    "signet": NetworkSettings(
+        "signet",
+        "Signet",
+        NETWORKS["signet"],
+        "https://mempool.space/signet",
+        38332,
+        ("https://signetfaucet.com/",),
+    ),
+    "main": NetworkSettings(
+        "main", "Mainnet", NETWORKS["main"], "https://mempool.space", 8332
+    ),
+}
+
+
+def _p2wpkh_address(pubkey_hash: bytes, hrp: str) -> str:
+    """Bech32 address of a P2WPKH output, encoded straight from its key hash
+
+    Skips building a Script and embit's script-type detection in
+    Script.address, since our address is always witness v0 P2WPKH.
+    """
+    return bech32.encode(hrp, 0, pubkey_hash)
 
 
 class WalletManager:
     """Manages wallet key generation, loading, and persistence"""
 
-    def __init__(self, wallet_file: str = "wallet.key", network_name: str = "test"):
+    def __init__(
+        self,
+        wallet_file: str = "wallet.key",
+        network_name: str = "test",
+        sign_backend: str = "auto",
+    ):
         self.wallet_file = wallet_file
-        self.network = NETWORKS[network_name]
+        self.network_name = network_name
+        self.network = NETWORK_SETTINGS[network_name].params
+        if sign_backend not in SIGN_BACKENDS:
+            raise ValueError(f"unknown signing backend: {sign_backend}")
+        if sign_backend == "coincurve" and coincurve is None:
+            raise ValueError("the coincurve signing backend needs coincurve installed")
+        # "auto" prefers coincurve when it's importable
+        self._use_coincurve = coincurve is not None and sign_backend != "embit"
         self.priv_key: Optional[ec.PrivateKey] = None
         self.pub_key: Optional[ec.PublicKey] = None
         self.address: Optional[str] = None
+        self.script_pubkey: Optional[script.Script] = None
+        # coincurve key for signing, built on first use and reused after
+        self._signing_key = None
 
     def load_or_generate_key(self) -> Tuple[ec.PrivateKey, ec.PublicKey, str]:
         """Load existing key or generate new one and save to filesystem"""
@@ -38,48 +196,149 @@ class WalletManager:
         else:
             print(f"✓ Generating new wallet and saving to {self.wallet_file}")
             self.priv_key = self._generate_and_save_key()
+        self._signing_key = None
 
-        self.pub_key = self.priv_key.get_public_key()
-        script_pubkey = script.p2wpkh(self.pub_key)
-        self.address = script_pubkey.address(network=self.network)
+        # Public key and address are cached in the wallet file; only derive
+        # them (an EC multiplication plus hashing) when the cache is missing
+        if self.pub_key is None or self.address is None:
+            self.pub_key = self._derive_public_key(self.priv_key)
+            self.script_pubkey, self.address = self._p2wpkh(self.pub_key)
+            try:
+                self._save_wallet(self.priv_key.wif())
+            except OSError as e:
+                # Only a speed-up for later runs; this one has what it needs
+                print(f"⚠️  Could not update the wallet file's cached address: {e}")
+        elif self.script_pubkey is None:
+            # Kept for change outputs and signing so it's hashed only once
+            self.script_pubkey = script.p2wpkh(self.pub_key)
 
         return self.priv_key, self.pub_key, self.address
 
     def _load_key(self) -> ec.PrivateKey:
-        """Load private key from wallet file"""
+        """Load private key (and cached public key/address) from wallet file"""
         try:
             with open(self.wallet_file, "r") as f:
-                wif = f.read().strip()
+                contents = f.read().strip()
 
-            if not wif:
+            if not contents:
                 raise ValueError("Wallet file is empty")
 
+            if contents.startswith("{"):
+                wallet = json.loads(contents)
+                wif = wallet["wif"]
+            else:
+                # Legacy format: bare WIF, migrated to JSON once derived
+                wallet = {}
+                wif = contents
+
             priv_key = ec.PrivateKey.from_wif(wif)
+
+            # Only trust the cache if it was written for this very WIF on this
+            # network, and the address really belongs to the cached key; those
+            # checks are hashing, not an EC multiply
+            address = wallet.get("addr")
+            network = wallet.get("network", self.network_name)
+            if (
+                wallet.get("pub")
+                and address
+                and network == self.network_name
+                and wallet.get("wif_sha256") == self._wif_fingerprint(wif)
+            ):
+                pub_key = ec.PublicKey.parse(bytes.fromhex(wallet["pub"]))
+                script_pubkey, derived_address = self._p2wpkh(pub_key)
+                if derived_address == address:
+                    self.pub_key = pub_key
+                    self.script_pubkey = script_pubkey
+                    self.address = address
+
             return priv_key
         except Exception as e:
             print(f"✗ Error loading wallet: {e}")
             sys.exit(1)
 
+    def _p2wpkh(self, pub_key: ec.PublicKey) -> Tuple[script.Script, str]:
+        """P2WPKH scriptPubKey and address for a public key, hashing it once"""
+        pubkey_hash = hashes.hash160(pub_key.sec())
+        return (
+            script.Script(b"\x00\x14" + pubkey_hash),
+            _p2wpkh_address(pubkey_hash, self.network["bech32"]),
+        )
+
+    def _derive_public_key(self, priv_key: ec.PrivateKey) -> ec.PublicKey:
+        """Derive the compressed public key with the selected backend"""
+        if self._use_coincurve and coincurve is not None:
+            sec = coincurve.PrivateKey(priv_key.secret).public_key.format(
+                compressed=True
+            )
+            return ec.PublicKey.parse(sec)
+        return priv_key.get_public_key()
+
+    def sign(self, msg_hash: bytes) -> bytes:
+        """Sign a 32-byte digest and return the DER-encoded ECDSA signature"""
+        if self._use_coincurve and coincurve is not None:
+            if self._signing_key is None:
+                self._signing_key = coincurve.PrivateKey(self.priv_key.secret)
+            return self._signing_key.sign(msg_hash, hasher=None)
+        return self.priv_key.sign(msg_hash).serialize()
+
+    @staticmethod
+    def _wif_fingerprint(wif: str) -> str:
+        """Fingerprint of the WIF that the cached public data belongs to"""
+        return hashlib.sha256(wif.encode()).hexdigest()
+
+    def _save_wallet(self, wif: str) -> None:
+        """Write the WIF and cached public key/address to the wallet file"""
+        wallet = {"wif": wif}
+        if self.pub_key is not None and self.address is not None:
+            wallet["pub"] = self.pub_key.sec().hex()
+            wallet["addr"] = self.address
+            wallet["network"] = self.network_name
+            # Ties the cache to this key, so an edited WIF is re-derived
+            wallet["wif_sha256"] = self._wif_fingerprint(wif)
+
+        # Write a private temp file and swap it in, so a crash mid-write
+        # never leaves a truncated wallet behind. mkstemp creates it 0600 with
+        # O_EXCL, so a leftover or planted file (or symlink) is never reused.
+        # Resolved first, so a symlinked wallet file stays a symlink
+        wallet_path = os.path.realpath(self.wallet_file)
+        wallet_dir, wallet_name = os.path.split(wallet_path)
+        fd, tmp_file = tempfile.mkstemp(
+            prefix=f".{wallet_name}.", suffix=".tmp", dir=wallet_dir
+        )
+        try:
+            try:
+                os.write(fd, json.dumps(wallet).encode())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, wallet_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_file)
+            raise
+
     def _generate_and_save_key(self) -> ec.PrivateKey:
         """Generate new private key and save to filesystem"""
         try:
-            # Generate random 256-bit private key
-            privdata = os.urandom(32)
+            # Generate random 256-bit private key from the OS CSPRNG
+            privdata = secrets.token_bytes(32)
             priv_key = ec.PrivateKey(privdata)
 
-            # Convert to WIF format for storage
-            wif = priv_key.wif(network=self.network)
+            # Derive public key and address once so later runs can skip it
+            self.pub_key = self._derive_public_key(priv_key)
+            self.script_pubkey, self.address = self._p2wpkh(self.pub_key)
 
-            # Save to file with restricted permissions
-            with open(self.wallet_file, "w") as f:
-                f.write(wif)
+            # Save WIF plus derived data to file with restricted permissions
+            self._save_wallet(priv_key.wif(network=self.network))
 
-            # Set file permissions to read/write for owner only (Unix-like systems)
-            if hasattr(os, "chmod"):
-                os.chmod(self.wallet_file, 0o600)
-
-            print(f"✓ Private key saved to {self.wallet_file}")
-            print("⚠️  IMPORTANT: Keep this file secure! It contains your private key.")
+            print(
+                "\n".join(
+                    [
+                        f"✓ Private key saved to {self.wallet_file}",
+                        "⚠️  IMPORTANT: Keep this file secure! It contains your private key.",
+                    ]
+                )
+            )
 
             return priv_key
         except Exception as e:
@@ -87,6 +346,106 @@ class WalletManager:
             sys.exit(1)
 
 
+@dataclass(slots=True, frozen=True)
+class SelectedUtxo:
+    """The UTXO being spent, as used by transaction building and signing"""
+
+    txid: str
+    txid_bytes: bytes
+    vout: int
+    value: int
+
+    @classmethod
+    def from_record(cls, utxo: Dict) -> "SelectedUtxo":
+        """Build from a UTXO record returned by UTXOManager.fetch_utxos"""
+        return cls(utxo["txid"], utxo["txid_bytes"], utxo["vout"], utxo["value"])
+
+
+def select_utxo(utxos: List[Dict], target: int) -> Dict:
+    """Pick the smallest UTXO worth at least target sats, else the largest
+
+    With one input, the smallest sufficient UTXO leaves the least change and
+    keeps larger coins whole for later. ``utxos`` must not be empty.
+    """
+    return min(
+        (u for u in utxos if u["value"] >= target),
+        key=lambda u: u["value"],
+        default=None,
+    ) or max(utxos, key=lambda u: u["value"])
+
+
+class RpcClient:
+    """Bitcoin Core JSON-RPC endpoint with its credentials kept out of the URL"""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        # Drop user:pass@ so the URL is safe to print; auth goes in a header
+        host = parts.netloc.rpartition("@")[2]
+        self.url = urlunsplit(parts._replace(netloc=host))
+        # For error messages: shows which user we tried without the password
+        self.safe_url = self.url
+        if parts.username is not None:
+            self.safe_url = urlunsplit(
+                parts._replace(netloc=f"{parts.username}:****@{host}")
+            )
+        self.port = parts.port
+        # Bodies are pre-serialized with _dump_json, so set the type ourselves
+        self.headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if parts.username is not None:
+            credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            token = base64.b64encode(credentials.encode()).decode()
+            self.headers["Authorization"] = f"Basic {token}"
+
+    def wallet_url(self, wallet: Optional[str] = None) -> str:
+        """URL for calls against a loaded wallet, or the node when None"""
+        if not wallet:
+            return self.url
+        return f"{self.url.rstrip('/')}/wallet/{wallet}"
+
+    @staticmethod
+    def payload(method: str, params: List) -> Dict:
+        """Build a single JSON-RPC request"""
+        return {
+            "jsonrpc": "1.0",
+            "id": "bitcoin-ops",
+            "method": method,
+            "params": params,
+        }
+
+    @staticmethod
+    def batch_payload(calls: List[Tuple[str, List]]) -> List[Dict]:
+        """Build a JSON-RPC batch whose ids are the positions of ``calls``"""
+        return [
+            {"jsonrpc": "1.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+
+
+def _write_cache_file(path: str, data: bytes) -> None:
+    """Atomically replace a cache file, ignoring failures
+
+    Each write goes through its own mkstemp file, so concurrent runs (or
+    threads) never interleave in a shared temp file before the rename.
+    """
+    cache_dir, name = os.path.split(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{name}.", suffix=".tmp", dir=cache_dir
+        )
+    except OSError:
+        return  # The cache is only an optimization
+    try:
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
 class UTXOManager:
     """Manages UTXO fetching and validation"""
 
@@ -99,30 +458,94 @@ class UTXOManager:
     ):
         self.network_name = network_name
         self.use_rpc = use_rpc
-        self.rpc_url = rpc_url
+        self.rpc = RpcClient(rpc_url) if rpc_url else None
         self.rpc_only = rpc_only
 
-        if network_name == "test":
-            self.api_base = "https://mempool.space/testnet/api"
-        else:
-            self.api_base = "https://mempool.space/api"
+        # Explorer pages and the REST API differ only by the /api segment
+        self.explorer_base = NETWORK_SETTINGS[network_name].explorer_base
+        self.api_base = f"{self.explorer_base}/api"
+
+        # Reuse connections to mempool.space and the local node across calls
+        self.session = self.new_session()
+
+        # Background mempool.space UTXO lookups, keyed by address
+        self._api_utxo_futures: Dict[str, Future] = {}
+
+    def new_session(self) -> requests.Session:
+        """A session with the retry policies for mempool.space and the node"""
+        session = requests.Session()
+        # Re-posting a broadcast is harmless (the same tx is just already
+        # known), so POSTs retry gateway errors and dropped connections too.
+        # mempool.space rate-limits with 429; Retry honours its Retry-After.
+        # Once retries run out the last response is returned rather than a
+        # RetryError, so callers still report its status and body.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if self.rpc:
+            # bitcoind reports RPC errors (spent inputs, bad fee) as HTTP 500,
+            # which must never be retried, and a read timeout usually means a
+            # slow call like scantxoutset is still running, so only retry
+            # when the request never reached the node or a proxy bounced it
+            rpc_adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=MAX_CONCURRENT_REQUESTS,
+                max_retries=Retry(
+                    total=3,
+                    read=0,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods={"POST"},
+                    raise_on_status=False,
+                ),
+            )
+            # The longest matching prefix wins, so this covers /wallet/ URLs
+            session.mount(self.rpc.url, rpc_adapter)
+
+        return session
+
+    def __enter__(self) -> "UTXOManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections to mempool.space and the local node"""
+        self.session.close()
 
-    def _rpc_call(self, method: str, params: List, timeout: int = 10) -> Optional[Dict]:
-        """Make an RPC call to Bitcoin Core"""
-        if not self.rpc_url:
+    def _rpc_call(
+        self,
+        method: str,
+        params: List,
+        timeout: int = 10,
+        wallet: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """Make an RPC call to Bitcoin Core, optionally against a loaded wallet"""
+        if not self.rpc:
             return None
 
         try:
-            payload = {
-                "jsonrpc": "1.0",
-                "id": "bitcoin-ops",
-                "method": method,
-                "params": params,
-            }
-            response = requests.post(self.rpc_url, json=payload, timeout=timeout)
+            response = self.session.post(
+                self.rpc.wallet_url(wallet),
+                data=_dump_json(self.rpc.payload(method, params)),
+                headers=self.rpc.headers,
+                timeout=(RPC_CONNECT_TIMEOUT, timeout),
+            )
 
             if response.status_code == 200:
-                result = response.json()
+                result = _parse_json(response)
                 if result.get("error"):
                     # Don't print error here, let caller handle it
                     return None
@@ -131,63 +554,180 @@ class UTXOManager:
         except RequestException:
             return None
 
+    def _rpc_batch(
+        self, calls: List[Tuple[str, List]], timeout: int = 10
+    ) -> Optional[List]:
+        """Make several RPC calls to Bitcoin Core in a single HTTP round-trip
+
+        Returns the results in the same order as ``calls``, with ``None`` in
+        place of any call that failed. Returns ``None`` if the batch itself
+        could not be sent, including when it is too large for bitcoind.
+        """
+        if not self.rpc:
+            return None
+
+        body = _dump_json(self.rpc.batch_payload(calls))
+        if len(body) > RPC_MAX_BODY_SIZE:
+            return None
+
+        try:
+            response = self.session.post(
+                self.rpc.url,
+                data=body,
+                headers=self.rpc.headers,
+                timeout=(RPC_CONNECT_TIMEOUT, timeout),
+            )
+
+            if response.status_code != 200:
+                return None
+
+            data = _parse_json(response)
+            # Proxies without batch support may answer with one error object
+            if not isinstance(data, list):
+                return None
+            results: List = [None] * len(calls)
+            for entry in data:
+                if not isinstance(entry, dict):
+                    continue
+                idx = entry.get("id")
+                if isinstance(idx, int) and 0 <= idx < len(calls):
+                    if not entry.get("error"):
+                        results[idx] = entry.get("result")
+            return results
+        except (RequestException, ValueError):
+            return None
+
     def _print_txindex_warning(self) -> None:
         """Print warning message about txindex not being enabled"""
-        print("\n✗ ERROR: txindex is not enabled on your Bitcoin Core node")
-        print("\n  This tool requires txindex=1 when using RPC mode.")
-        print("\n  To enable txindex:")
-        print("    1. Add 'txindex=1' to your bitcoin.conf")
-        print("    2. Restart Bitcoin Core (it will reindex the blockchain)")
-        print("    3. Wait for reindexing to complete (may take several hours)")
-        print("\n  Or run without RPC flags to use mempool.space API only")
         print(
-            "\n  Alternatively, use --rpc-only for slow scantxoutset mode (no txindex needed)"
+            "\n".join(
+                [
+                    "\n✗ ERROR: txindex is not enabled on your Bitcoin Core node",
+                    "\n  This tool requires txindex=1 when using RPC mode.",
+                    "\n  To enable txindex:",
+                    "    1. Add 'txindex=1' to your bitcoin.conf",
+                    "    2. Restart Bitcoin Core (it will reindex the blockchain)",
+                    "    3. Wait for reindexing to complete (may take several hours)",
+                    "\n  Or run without RPC flags to use mempool.space API only",
+                    "\n  Alternatively, use --rpc-only for slow scantxoutset mode (no txindex needed)",
+                ]
+            )
         )
 
     def check_txindex_enabled(self) -> bool:
         """Check if txindex is enabled on the Bitcoin Core node"""
-        if not self.rpc_url:
+        if not self.rpc:
             return False
 
-        # Try to get blockchain info which includes txindex status
-        result = self._rpc_call("getblockchaininfo", [])
-        if result and "blocks" in result:
-            # Node is accessible, check if we can fetch a non-coinbase transaction
-            # Use a known testnet transaction (not genesis/coinbase which can't be fetched)
-            # This is one of the user's successful OP_RETURN transactions from history
-            test_txid = (
-                "63611617ee33c761c2c9586d0f998baa16bfd876b703921a6a1b31c2933abf64"
-            )
-            test_result = self._rpc_call("getrawtransaction", [test_txid, False])
+        # getindexinfo (Bitcoin Core 0.21+) reports txindex state directly,
+        # on any network; it's absent from the result when txindex is off
+        result = self._rpc_call("getindexinfo", [])
+        return bool(result and result.get("txindex", {}).get("synced"))
 
-            if test_result:
-                return True
-            else:
-                return False
-        return False
+    def prefetch_utxos_api(self, address: str, executor: Executor) -> None:
+        """Start the mempool.space UTXO lookup used by the hybrid RPC path"""
+        self._api_utxo_futures[address] = executor.submit(
+            self._fetch_utxos_api, address
+        )
 
     def fetch_utxos(self, address: str) -> List[Dict]:
-        """Fetch all UTXOs for an address from RPC or mempool.space API"""
-        if self.use_rpc and self.rpc_url:
-            return self._fetch_utxos_rpc(address)
+        """Fetch all UTXOs for an address from RPC or mempool.space API
+
+        The list is also written to the disk cache, where later runs find it
+        with read_utxo_cache before starting any lookups.
+        """
+        if self.use_rpc and self.rpc:
+            utxos = self._fetch_utxos_rpc(address)
         else:
-            return self._fetch_utxos_api(address)
+            utxos = self._fetch_utxos_api(address)
+        # Failures also come back empty, and an unfunded address is worth
+        # re-checking on the next run, so only non-empty lists are kept
+        if utxos:
+            self._write_utxo_cache(address, utxos)
+        return utxos
+
+    @property
+    def utxo_source(self) -> str:
+        """Where fetch_utxos gets its list: api, rpc or rpc-only"""
+        if self.use_rpc and self.rpc:
+            return "rpc-only" if self.rpc_only else "rpc"
+        return "api"
+
+    def _utxo_cache_path(self, address: str, source: Optional[str] = None) -> str:
+        """Path of the cached UTXO list for an address, network and source"""
+        source = source or self.utxo_source
+        return os.path.join(
+            CACHE_DIR, f"utxos-{self.network_name}-{source}-{address}.json"
+        )
+
+    def read_utxo_cache(self, address: str, max_age: float) -> Optional[List[Dict]]:
+        """Return the cached UTXO list if it is younger than max_age seconds
+
+        Only lists fetched the same way are reused, so --rpc-only never sees
+        one that came from mempool.space.
+        """
+        try:
+            with open(self._utxo_cache_path(address), "rb") as f:
+                cached = json.loads(f.read())
+            age = time.time() - cached["ts"]
+            if not 0 <= age < max_age:
+                return None
+            utxos = [
+                self._compact_utxo(u["txid"], u["vout"], u["value"], u["confirmed"])
+                for u in cached["utxos"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        print(f"  ✓ Using UTXO list cached {age:.0f}s ago (--no-cache to refresh)")
+        return utxos
+
+    def _write_utxo_cache(self, address: str, utxos: List[Dict]) -> None:
+        """Store a freshly fetched UTXO list for later runs"""
+        cached = {
+            "ts": time.time(),
+            "utxos": [
+                {
+                    "txid": u["txid"],
+                    "vout": u["vout"],
+                    "value": u["value"],
+                    "confirmed": u["status"]["confirmed"],
+                }
+                for u in utxos
+            ],
+        }
+        _write_cache_file(self._utxo_cache_path(address), _dump_json(cached))
+
+    def invalidate_utxo_cache(self, address: str) -> None:
+        """Forget the cached UTXO lists, e.g. once one of them is being spent"""
+        for source in ("api", "rpc", "rpc-only"):
+            with contextlib.suppress(OSError):
+                os.remove(self._utxo_cache_path(address, source))
 
     def _fetch_utxos_rpc(self, address: str) -> List[Dict]:
         """Fetch UTXOs using Bitcoin Core RPC"""
         try:
             if self.rpc_only:
+                # Once the address is imported into a watch-only wallet,
+                # listunspent answers without scanning the whole UTXO set
+                utxos = self._fetch_utxos_watch_wallet(address)
+                if utxos is not None:
+                    return utxos
+
                 # Use scantxoutset to find UTXOs (RPC only mode)
-                print("  Using Bitcoin Core RPC only (scantxoutset)...")
                 print(
-                    "  ⚠️  Warning: This may take 30-60 seconds to scan the UTXO set..."
+                    "\n".join(
+                        [
+                            "  Using Bitcoin Core RPC only (scantxoutset)...",
+                            "  ⚠️  Warning: This may take 30-60 seconds to scan the UTXO set...",
+                        ]
+                    )
                 )
 
                 # Use scantxoutset to find UTXOs for this address
                 result = self._rpc_call(
                     "scantxoutset",
                     ["start", [f"addr({address})"]],
-                    timeout=120,  # Increase timeout for scantxoutset
+                    timeout=120,  # Read timeout; scantxoutset can take a while
                 )
 
                 if not result:
@@ -195,22 +735,19 @@ class UTXOManager:
                     return []
 
                 # Convert scantxoutset format to our format
-                utxos = []
-                for unspent in result.get("unspents", []):
-                    utxos.append(
-                        {
-                            "txid": unspent["txid"],
-                            "vout": unspent["vout"],
-                            "value": int(
-                                unspent["amount"] * 100_000_000
-                            ),  # BTC to sats
-                            "status": {
-                                "confirmed": True
-                            },  # scantxoutset only returns confirmed
-                        }
+                # (scantxoutset only returns confirmed outputs)
+                utxos = [
+                    self._compact_utxo(
+                        unspent["txid"],
+                        unspent["vout"],
+                        round(unspent["amount"] * 100_000_000),  # BTC to sats
+                        True,
                     )
+                    for unspent in result.get("unspents", [])
+                ]
 
                 print(f"  ✓ Found {len(utxos)} UTXOs via scantxoutset")
+                self._setup_watch_wallet(address, result)
                 return utxos
             else:
                 # Hybrid mode: use mempool.space for discovery, RPC for verification
@@ -222,20 +759,44 @@ class UTXOManager:
                 # and listunspent requires the address to be imported into the wallet.
                 # For transaction fetching and broadcasting, we'll still use RPC.
                 print("  → Getting UTXO list from mempool.space (faster)...")
-                utxos = self._fetch_utxos_api(address)
+                future = self._api_utxo_futures.pop(address, None)
+                utxos = future.result() if future else self._fetch_utxos_api(address)
 
                 # If we found UTXOs via API, verify they exist via RPC
-                if utxos and self.rpc_url:
+                if utxos and self.rpc:
                     print("  → Verifying UTXOs with local node...")
-                    verified_utxos = []
-                    for utxo in utxos:
-                        # Try to get the transaction via RPC to verify it exists locally
-                        tx_result = self._rpc_call(
-                            "getrawtransaction", [utxo["txid"], True]
-                        )
-                        if tx_result:
-                            # UTXO exists in local node
-                            verified_utxos.append(utxo)
+                    # Look up every funding transaction in one batched request;
+                    # raw hex is far smaller than the verbose JSON decode
+                    txids = list(dict.fromkeys(utxo["txid"] for utxo in utxos))
+                    results = self._rpc_batch(
+                        [("getrawtransaction", [txid, False]) for txid in txids]
+                    )
+                    if results is None:
+                        # Some RPC proxies reject batches, and huge ones would
+                        # exceed bitcoind's body limit; issue the lookups
+                        # concurrently instead of one after another
+                        with ThreadPoolExecutor(
+                            max_workers=MAX_CONCURRENT_REQUESTS
+                        ) as executor:
+                            results = list(
+                                executor.map(
+                                    lambda txid: self._rpc_call(
+                                        "getrawtransaction", [txid, False]
+                                    ),
+                                    txids,
+                                )
+                            )
+                    raw_txs = {
+                        txid: bytes.fromhex(raw)
+                        for txid, raw in zip(txids, results)
+                        if raw
+                    }
+                    verified_utxos = [
+                        utxo
+                        for utxo in utxos
+                        if utxo["txid"] in raw_txs
+                        and self._output_matches(raw_txs[utxo["txid"]], utxo)
+                    ]
 
                     if verified_utxos:
                         print(
@@ -244,9 +805,13 @@ class UTXOManager:
                         return verified_utxos
                     else:
                         print(
-                            "  ⚠️  Warning: UTXOs not found in local node (may not be fully synced)"
+                            "\n".join(
+                                [
+                                    "  ⚠️  Warning: UTXOs not found in local node (may not be fully synced)",
+                                    "  Using mempool.space data anyway...",
+                                ]
+                            )
                         )
-                        print("  Using mempool.space data anyway...")
 
                 return utxos
 
@@ -257,21 +822,193 @@ class UTXOManager:
                 return self._fetch_utxos_api(address)
             return []
 
+    @staticmethod
+    def _output_matches(raw_tx: bytes, utxo: Dict) -> bool:
+        """Check that the node's copy of the funding tx has the UTXO's output"""
+        try:
+            return _read_output(raw_tx, utxo["vout"]).value == utxo["value"]
+        except ValueError:
+            return False
+
+    def _watch_marker(self, address: str) -> str:
+        """Path of the file recording that an address is in the watch wallet"""
+        return os.path.join(CACHE_DIR, f"watch-{address}")
+
+    def _fetch_utxos_watch_wallet(self, address: str) -> Optional[List[Dict]]:
+        """Fetch UTXOs via listunspent if the address was imported earlier
+
+        Returns None when the watch-only wallet isn't set up or can't be used,
+        so the caller falls back to scantxoutset.
+        """
+        try:
+            with open(self._watch_marker(address), "r") as f:
+                wallet = f.read().strip()
+        except OSError:
+            return None
+
+        print(f"  Using Bitcoin Core RPC only (watch-only wallet '{wallet}')...")
+        params = [0, 9_999_999, [address]]
+        result = self._rpc_call("listunspent", params, wallet=wallet)
+        if result is None:
+            # The wallet isn't loaded automatically after a node restart
+            self._rpc_call("loadwallet", [wallet], timeout=60)
+            result = self._rpc_call("listunspent", params, wallet=wallet)
+        if result is None:
+            print("  ⚠️  Watch-only wallet unavailable, falling back to scantxoutset")
+            return None
+
+        utxos = [
+            self._compact_utxo(
+                unspent["txid"],
+                unspent["vout"],
+                round(unspent["amount"] * 100_000_000),  # BTC to sats
+                unspent.get("confirmations", 0) > 0,
+            )
+            for unspent in result
+        ]
+        print(f"  ✓ Found {len(utxos)} UTXOs via listunspent")
+        return utxos
+
+    def _setup_watch_wallet(self, address: str, scan_result: Dict) -> None:
+        """Import the address into a watch-only wallet for future runs
+
+        The rescan starts at the oldest block holding one of the outputs
+        scantxoutset just found: anything older has already been spent.
+        """
+        wallet = WATCH_WALLET_NAME
+        # Watch-only (no private keys), blank, descriptor wallet
+        created = self._rpc_call("createwallet", [wallet, True, True, "", False, True])
+        if created is None:
+            # Already exists; make sure it's loaded (an error if it already is)
+            self._rpc_call("loadwallet", [wallet], timeout=60)
+
+        # An import from an earlier run may have timed out on our side while
+        # the node carried on rescanning; don't queue a second rescan
+        wallet_info = self._rpc_call("getwalletinfo", [], wallet=wallet)
+        if wallet_info and wallet_info.get("scanning"):
+            print(
+                "  ⌛ Watch-only wallet is still rescanning; try again once it's done"
+            )
+            return
+        address_info = self._rpc_call("getaddressinfo", [address], wallet=wallet)
+        if address_info and address_info.get("ismine"):
+            # That earlier import has since finished
+            self._write_watch_marker(address, wallet)
+            return
+
+        info = self._rpc_call("getdescriptorinfo", [f"addr({address})"])
+        if not info:
+            return
+
+        timestamp = "now"
+        heights = [u["height"] for u in scan_result.get("unspents", [])]
+        if heights:
+            block_hash = self._rpc_call("getblockhash", [min(heights)])
+            header = (
+                self._rpc_call("getblockheader", [block_hash]) if block_hash else None
+            )
+            if not header:
+                return
+            timestamp = header["time"]
+
+        print(
+            "\n".join(
+                [
+                    "  → Importing address into watch-only wallet for faster future runs...",
+                    "  ⚠️  The node rescans the chain for it, which can take several minutes",
+                ]
+            )
+        )
+        request = [{"desc": info["descriptor"], "timestamp": timestamp}]
+        result = self._rpc_call(
+            "importdescriptors", [request], timeout=600, wallet=wallet
+        )
+        if result is None:
+            wallet_info = self._rpc_call("getwalletinfo", [], wallet=wallet)
+            if wallet_info and wallet_info.get("scanning"):
+                print(
+                    "  ⌛ Still rescanning in the background; a later run will use it once done"
+                )
+                return
+        if not result or not all(r.get("success") for r in result):
+            print("  ⚠️  Could not import address; scantxoutset will be used again")
+            return
+
+        self._write_watch_marker(address, wallet)
+
+    def _write_watch_marker(self, address: str, wallet: str) -> None:
+        """Record that an address is in the watch-only wallet"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._watch_marker(address), "w") as f:
+                f.write(wallet)
+        except OSError as e:
+            print(f"  ⚠️  Could not record watch-only wallet setup: {e}")
+
     def _fetch_utxos_api(self, address: str) -> List[Dict]:
         """Fetch all UTXOs for an address from mempool.space API"""
         try:
             print("  Using mempool.space API...")
             url = f"{self.api_base}/address/{address}/utxo"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return [
+                self._compact_utxo(
+                    u["txid"],
+                    u["vout"],
+                    u["value"],
+                    u.get("status", {}).get("confirmed", False),
+                )
+                for u in _parse_json(response)
+            ]
         except RequestException as e:
             print(f"✗ Error fetching UTXOs: {e}")
             return []
 
+    @staticmethod
+    def _compact_utxo(txid: str, vout: int, value: int, confirmed: bool) -> Dict:
+        """Build the UTXO record shared by every discovery path
+
+        Only the fields we use are kept, so API responses don't drag block
+        hashes and timestamps around for every UTXO.
+        """
+        return {
+            "txid": txid,
+            # Decoded once here so transaction building doesn't re-parse hex
+            "txid_bytes": bytes.fromhex(txid),
+            "vout": vout,
+            "value": value,
+            "status": {"confirmed": confirmed},
+        }
+
+    def iter_address_transactions(self, address: str) -> Iterator[Dict]:
+        """Yield every transaction for an address from mempool.space, newest first
+
+        The first page includes mempool transactions; older confirmed
+        transactions are paged through 25 at a time via /txs/chain.
+        """
+        url = f"{self.api_base}/address/{address}/txs"
+        while True:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            page = _parse_json(response)
+
+            last_confirmed = None
+            confirmed_count = 0
+            for tx in page:
+                yield tx
+                if tx.get("status", {}).get("confirmed"):
+                    last_confirmed = tx["txid"]
+                    confirmed_count += 1
+
+            # A short page of confirmed transactions means we've reached the end
+            if last_confirmed is None or confirmed_count < 25:
+                return
+            url = f"{self.api_base}/address/{address}/txs/chain/{last_confirmed}"
+
     def fetch_transaction(self, txid: str) -> Optional[Transaction]:
         """Fetch transaction by txid from RPC or API"""
-        if self.use_rpc and self.rpc_url:
+        if self.use_rpc and self.rpc:
             return self._fetch_transaction_rpc(txid)
         else:
             return self._fetch_transaction_api(txid)
@@ -285,30 +1022,39 @@ class UTXOManager:
 
             # If RPC failed, txindex is likely not enabled
             print(
-                f"\n✗ ERROR: Could not fetch transaction {txid[:16]}... from local node"
-            )
-            print(
-                "  This usually means txindex is not enabled in your Bitcoin Core node."
+                "\n".join(
+                    [
+                        f"\n✗ ERROR: Could not fetch transaction {txid[:16]}... from local node",
+                        "  This usually means txindex is not enabled in your Bitcoin Core node.",
+                        "\n  To enable txindex:",
+                        "    1. Add 'txindex=1' to your bitcoin.conf",
+                        "    2. Restart Bitcoin Core (it will reindex the blockchain)",
+                        "    3. Wait for reindexing to complete",
+                        "\n  Or run without RPC flags to use mempool.space API only",
+                    ]
+                )
             )
-            print("\n  To enable txindex:")
-            print("    1. Add 'txindex=1' to your bitcoin.conf")
-            print("    2. Restart Bitcoin Core (it will reindex the blockchain)")
-            print("    3. Wait for reindexing to complete")
-            print("\n  Or run without RPC flags to use mempool.space API only")
             return None
         except Exception as e:
-            print(f"\n✗ RPC transaction fetch failed: {e}")
-            print("  Make sure txindex=1 is enabled in bitcoin.conf")
+            print(
+                "\n".join(
+                    [
+                        f"\n✗ RPC transaction fetch failed: {e}",
+                        "  Make sure txindex=1 is enabled in bitcoin.conf",
+                    ]
+                )
+            )
             return None
 
     def _fetch_transaction_api(self, txid: str) -> Optional[Transaction]:
         """Fetch transaction by txid from mempool.space API"""
         try:
-            url = f"{self.api_base}/tx/{txid}/hex"
-            response = requests.get(url, timeout=10)
+            # /raw serves the serialized tx as binary: half the bytes of /hex
+            # and parsed straight from the body with no hex decode
+            url = f"{self.api_base}/tx/{txid}/raw"
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            # Parse hex transaction string into Transaction object
-            return Transaction.parse(bytes.fromhex(response.text.strip()))
+            return Transaction.parse(response.content)
         except RequestException as e:
             print(f"✗ Error fetching transaction: {e}")
             return None
@@ -316,23 +1062,182 @@ class UTXOManager:
             print(f"✗ Error parsing transaction: {e}")
             return None
 
+    def send_transaction_rpc(
+        self, tx_hex: str, session: Optional[requests.Session] = None
+    ) -> str:
+        """Broadcast via sendrawtransaction and return the txid
+
+        Raises RequestException on network errors and RuntimeError when the
+        node rejects the transaction. ``session`` defaults to the shared one.
+        """
+        response = (session or self.session).post(
+            self.rpc.url,
+            data=_dump_json(self.rpc.payload("sendrawtransaction", [tx_hex])),
+            headers=self.rpc.headers,
+            timeout=(RPC_CONNECT_TIMEOUT, 10),
+        )
+        try:
+            # RPC errors come back as HTTP 500 with a JSON error body
+            result = _parse_json(response)
+        except ValueError:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+        if result.get("error"):
+            raise RuntimeError(str(result["error"]))
+        return result["result"]
+
+    def send_transaction_api(
+        self, tx_hex: bytes, session: Optional[requests.Session] = None
+    ) -> str:
+        """Broadcast via mempool.space and return the txid
+
+        Raises RequestException on network errors and RuntimeError when the
+        transaction is rejected. ``session`` defaults to the shared one.
+        """
+        response = (session or self.session).post(
+            f"{self.api_base}/tx", data=tx_hex, timeout=10
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+        return response.text.strip()
+
     def display_utxos(self, utxos: List[Dict]) -> None:
         """Display available UTXOs in a formatted way"""
         if not utxos:
             print("No UTXOs found for this address.")
             return
 
-        print(f"\nAvailable UTXOs ({len(utxos)} found):")
-        print("-" * 80)
+        # Formatted up front and written with one print, so a wallet with
+        # thousands of UTXOs doesn't pay for thousands of stdout writes
+        lines = [f"\nAvailable UTXOs ({len(utxos)} found):", _SEP_DASH]
         for i, utxo in enumerate(utxos):
             btc_value = utxo["value"] / 100_000_000
-            print(f"[{i}] TXID: {utxo['txid']}")
-            print(f"    VOUT: {utxo['vout']}")
-            print(f"    Amount: {utxo['value']} sats ({btc_value:.8f} BTC)")
-            print(
-                f"    Status: {'Confirmed' if utxo.get('status', {}).get('confirmed') else 'Unconfirmed'}"
+            status = (
+                "Confirmed"
+                if utxo.get("status", {}).get("confirmed")
+                else "Unconfirmed"
+            )
+            lines.append(
+                f"[{i}] TXID: {utxo['txid']}\n"
+                f"    VOUT: {utxo['vout']}\n"
+                f"    Amount: {utxo['value']} sats ({btc_value:.8f} BTC)\n"
+                f"    Status: {status}\n"
             )
-            print()
+        print("\n".join(lines))
+
+
+def _dsha256(data: bytes) -> bytes:
+    """Double SHA-256, as used for Bitcoin transaction digests"""
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
+
+# Little-endian integer readers; unpack_from reads in place without slicing
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+_VARINT_READERS = {0xFD: _UINT16, 0xFE: _UINT32, 0xFF: _UINT64}
+
+
+def _varint_len(n: int) -> int:
+    """Serialized size of n as a Bitcoin CompactSize"""
+    if n < 0xFD:
+        return 1
+    if n <= 0xFFFF:
+        return 3
+    if n <= 0xFFFFFFFF:
+        return 5
+    return 9
+
+
+def _read_varint(view: memoryview, pos: int) -> Tuple[int, int]:
+    """Read a Bitcoin CompactSize at pos, returning (value, next position)"""
+    first = view[pos]
+    if first < 0xFD:
+        return first, pos + 1
+    reader = _VARINT_READERS[first]
+    return reader.unpack_from(view, pos + 1)[0], pos + 1 + reader.size
+
+
+def _read_output(raw_tx: bytes, index: int) -> TransactionOutput:
+    """Decode a single output of a serialized transaction
+
+    Inputs and earlier outputs are skipped by length rather than parsed, and
+    witness data after the outputs is never touched.
+    """
+    view = memoryview(raw_tx)
+    try:
+        pos = 4
+        if view[4] == 0 and view[5] == 1:
+            pos = 6  # Segwit marker and flag
+        count, pos = _read_varint(view, pos)
+        for _ in range(count):
+            # Outpoint, then scriptSig, then sequence
+            script_len, pos = _read_varint(view, pos + 36)
+            pos += script_len + 4
+        count, pos = _read_varint(view, pos)
+        if not 0 <= index < count:
+            raise ValueError(f"output {index} out of range (tx has {count})")
+        for _ in range(index):
+            script_len, pos = _read_varint(view, pos + 8)
+            pos += script_len
+        (value,) = _UINT64.unpack_from(view, pos)
+        script_len, pos = _read_varint(view, pos + 8)
+    except (IndexError, struct.error):
+        raise ValueError("truncated transaction")
+    if pos + script_len > len(view):
+        raise ValueError("truncated transaction")
+    return TransactionOutput(value, script.Script(bytes(view[pos : pos + script_len])))
+
+
+# OP_RETURN script prefixes for every payload length that fits one length byte
+_OP_RETURN_HEADERS = tuple(
+    bytes((0x6A, n)) if n <= 75 else bytes((0x6A, 0x4C, n)) for n in range(256)
+)
+
+
+def _op_return_script_size(data_len: int) -> int:
+    """Size of the OP_RETURN script _create_op_return_script builds for data_len"""
+    if data_len <= 255:
+        return len(_OP_RETURN_HEADERS[data_len]) + data_len
+    return 4 + data_len
+
+
+def _parse_op_return(script_bytes: bytes) -> bytes:
+    """Extract the data pushed by an OP_RETURN script
+
+    Mirrors the push encodings produced by
+    OPReturnTransactionBuilder._create_op_return_script.
+    """
+    size = len(script_bytes)
+    if not size or script_bytes[0] != 0x6A:
+        raise ValueError("not an OP_RETURN script")
+    if size == 1:
+        return b""
+
+    opcode = script_bytes[1]
+    if opcode <= 75:
+        # Direct push (0x01-0x4b)
+        data_start = 2
+        data_len = opcode
+    elif opcode == 0x4C and size >= 3:
+        # OP_PUSHDATA1
+        data_start = 3
+        data_len = script_bytes[2]
+    elif opcode == 0x4D and size >= 4:
+        # OP_PUSHDATA2
+        data_start = 4
+        (data_len,) = _UINT16.unpack_from(script_bytes, 2)
+    elif opcode == 0x4E and size >= 6:
+        # OP_PUSHDATA4
+        data_start = 6
+        (data_len,) = _UINT32.unpack_from(script_bytes, 2)
+    elif opcode in (0x4C, 0x4D, 0x4E):
+        raise ValueError("truncated OP_RETURN push")
+    else:
+        # Unknown format
+        data_start = 2
+        data_len = size - 2
+
+    return script_bytes[data_start : data_start + data_len]
 
 
 class OPReturnTransactionBuilder:
@@ -349,109 +1254,178 @@ class OPReturnTransactionBuilder:
         # For data <= 75 bytes: OP_RETURN <push_length> <data>
         # For data 76-255 bytes: OP_RETURN OP_PUSHDATA1 <length> <data>
         # For data 256-65535 bytes: OP_RETURN OP_PUSHDATA2 <length_2bytes_LE> <data>
-        if len(data) <= 75:
-            op_return_script_bytes = bytes([0x6A, len(data)]) + data
-        elif len(data) <= 255:
-            # OP_PUSHDATA1 (0x4c) for data 76-255 bytes
-            op_return_script_bytes = bytes([0x6A, 0x4C, len(data)]) + data
-        elif len(data) <= 65535:
+        n = len(data)
+        if n <= 255:
+            # Direct push or OP_PUSHDATA1 (0x4c), from the precomputed table
+            header = _OP_RETURN_HEADERS[n]
+        elif n <= 65535:
             # OP_PUSHDATA2 (0x4d) for data 256-65535 bytes
             # Length is encoded as 2 bytes in little-endian
-            length_bytes = len(data).to_bytes(2, byteorder="little")
-            op_return_script_bytes = bytes([0x6A, 0x4D]) + length_bytes + data
+            header = b"\x6a\x4d" + n.to_bytes(2, byteorder="little")
         else:
-            raise ValueError(f"OP_RETURN data too large: {len(data)} bytes (max 65535)")
+            raise ValueError(f"OP_RETURN data too large: {n} bytes (max 65535)")
 
-        return script.Script(op_return_script_bytes)
+        # Single concatenation of the small header with the payload
+        return script.Script(header + data)
 
     def create_transaction(
         self,
-        utxo_txid: str,
+        utxo_txid_bytes: bytes,
         utxo_vout: int,
         utxo_amount: int,
         op_return_data_list: List[bytes],
-        prev_tx: Transaction,
     ) -> Transaction:
         """Create an OP_RETURN transaction with one or more OP_RETURN outputs"""
+        tx = self._build_skeleton(utxo_txid_bytes, utxo_vout, op_return_data_list)
+        return self._finalize_fee(
+            tx, utxo_amount, self.estimate_fee(op_return_data_list)
+        )
 
-        # Create transaction
-        tx = Transaction(version=2, locktime=0)
+    def _build_skeleton(
+        self,
+        utxo_txid_bytes: bytes,
+        utxo_vout: int,
+        op_return_data_list: List[bytes],
+    ) -> Transaction:
+        """Build the fee-independent parts of the transaction
+
+        The input and OP_RETURN outputs are final; the change output is a
+        zero-value placeholder that _finalize_fee fills in.
+        """
+        # Create transaction; pass fresh lists since embit's defaults are shared
+        tx = Transaction(version=2, vin=[], vout=[], locktime=0)
 
         # Add input
-        txin = TransactionInput(bytes.fromhex(utxo_txid), utxo_vout)
-        tx.vin.append(txin)
-
-        # Add OP_RETURN outputs
-        total_op_return_size = 0
-        for op_return_data in op_return_data_list:
-            op_return_script = self._create_op_return_script(op_return_data)
-            op_return_output = TransactionOutput(
-                value=0, script_pubkey=op_return_script
-            )
-            tx.vout.append(op_return_output)
-            total_op_return_size += 10 + len(
-                op_return_data
-            )  # ~10 bytes overhead per output
-
-        # Calculate estimated size and fee
-        # Base size: ~10 bytes overhead + input (~68 bytes for P2WPKH) + outputs
-        # OP_RETURN outputs: calculated above
-        # Change output: ~31 bytes for P2WPKH
-        estimated_vsize = 10 + 68 + total_op_return_size + 31
-        # Fee can be fractional, but final amount must be integer sats
-        fee = int(self.fee_rate * estimated_vsize)
-
-        # Ensure minimum fee of 1 sat (for very low fee rates)
-        if fee < 1:
-            fee = 1
-
-        # Calculate change
-        change_amount = utxo_amount - fee
+        tx.vin.append(TransactionInput(utxo_txid_bytes, utxo_vout))
+
+        # Add OP_RETURN outputs, then the change placeholder
+        tx.vout.extend(
+            TransactionOutput(value=0, script_pubkey=self._create_op_return_script(d))
+            for d in op_return_data_list
+        )
+        tx.vout.append(TransactionOutput(0, self.wallet.script_pubkey))
+        return tx
+
+    def _finalize_fee(self, tx: Transaction, utxo_amount: int, fee: int) -> Transaction:
+        """Set the change output for a fee, dropping it if it would be dust
+
+        Only the change output is touched, so the same skeleton can be
+        finalized again with a different fee (e.g. after a fee bump).
+        """
+        # OP_RETURN scripts never match ours, so this finds only the change
+        if tx.vout and tx.vout[-1].script_pubkey == self.wallet.script_pubkey:
+            change_output = tx.vout.pop()
+        else:
+            change_output = TransactionOutput(0, self.wallet.script_pubkey)
 
-        if change_amount < 546:  # Dust limit
+        change_amount = utxo_amount - fee
+        if change_amount < DUST_LIMIT:
             print(
-                f"⚠️  Warning: Change amount ({change_amount} sats) is below dust limit."
+                "\n".join(
+                    [
+                        f"⚠️  Warning: Change amount ({change_amount} sats) is below dust limit.",
+                        f"    Total fee will be {utxo_amount} sats instead of {fee} sats",
+                    ]
+                )
             )
-            print(f"    Total fee will be {utxo_amount} sats instead of {fee} sats")
             # Don't add change output, all goes to fee
         else:
-            # Add change output
-            change_script = script.p2wpkh(self.wallet.pub_key)
-            change_output = TransactionOutput(
-                value=change_amount, script_pubkey=change_script
-            )
+            change_output.value = change_amount
             tx.vout.append(change_output)
 
         return tx
 
-    def sign_transaction(
+    def estimate_fee(self, op_return_data_list: List[bytes]) -> int:
+        """Fee for a transaction carrying these payloads plus a change output"""
+        # Rounding up keeps a fractional fee rate from ever paying below it
+        estimated_vsize = self._estimate_vsize(op_return_data_list)
+        return max(1, math.ceil(self.fee_rate * estimated_vsize))
+
+    @staticmethod
+    def _estimate_vsize(op_return_data_list: List[bytes]) -> int:
+        """Virtual size of the signed transaction once a change output is added
+
+        Exact apart from the signature, which is assumed to take its maximum
+        length, so the result is never below the real size.
+        """
+        output_count = len(op_return_data_list) + 1
+        script_sizes = [_op_return_script_size(len(d)) for d in op_return_data_list]
+        base_size = (
+            _TX_VERSION_LOCKTIME_BYTES
+            + 1
+            + _P2WPKH_INPUT_BYTES
+            + _varint_len(output_count)
+            + sum(8 + _varint_len(size) + size for size in script_sizes)
+            + _P2WPKH_OUTPUT_BYTES
+        )
+        weight = 4 * base_size + _P2WPKH_WITNESS_BYTES
+        return (weight + 3) // 4
+
+    @staticmethod
+    def _bip143_midstate(tx: Transaction) -> Tuple[bytes, bytes, bytes]:
+        """Hash the parts of the BIP143 preimage shared by every input
+
+        Returns (hashPrevouts, hashSequence, hashOutputs). Computing these
+        once per transaction keeps signing N inputs O(N) instead of O(N^2).
+        """
+        hash_prevouts = _dsha256(
+            b"".join(inp.txid[::-1] + inp.vout.to_bytes(4, "little") for inp in tx.vin)
+        )
+        hash_sequence = _dsha256(
+            b"".join(inp.sequence.to_bytes(4, "little") for inp in tx.vin)
+        )
+        hash_outputs = _dsha256(b"".join(out.serialize() for out in tx.vout))
+        return hash_prevouts, hash_sequence, hash_outputs
+
+    def _segwit_sighash(
         self,
         tx: Transaction,
-        utxo_txid: str,
-        utxo_vout: int,
-        prev_output: TransactionOutput,
-    ) -> Transaction:
-        """Sign transaction using PSBT"""
-
-        # Create PSBT
-        psbt = PSBT(tx)
-
-        # Set witness UTXO info for P2WPKH (segwit) inputs
-        psbt.inputs[0].witness_utxo = prev_output
-
-        # Sign with private key (embit handles the sighash internally)
-        psbt.sign_with(self.wallet.priv_key)
-
-        # Finalize the PSBT (creates the witness structure)
-        # Note: finalize_psbt returns a NEW transaction object with witnesses
-        final_tx = finalize_psbt(psbt)
-
-        if final_tx is None:
-            raise RuntimeError(
-                "Failed to finalize PSBT - transaction may be missing signatures"
+        input_index: int,
+        value: int,
+        midstate: Optional[Tuple[bytes, bytes, bytes]] = None,
+    ) -> bytes:
+        """Compute the BIP143 SIGHASH_ALL digest for one of our P2WPKH inputs"""
+        if midstate is None:
+            midstate = self._bip143_midstate(tx)
+        hash_prevouts, hash_sequence, hash_outputs = midstate
+
+        inp = tx.vin[input_index]
+        # For P2WPKH the scriptCode is the P2PKH script of the same key hash
+        pubkey_hash = self.wallet.script_pubkey.data[2:]
+        script_code = b"\x19\x76\xa9\x14" + pubkey_hash + b"\x88\xac"
+
+        preimage = b"".join(
+            (
+                tx.version.to_bytes(4, "little"),
+                hash_prevouts,
+                hash_sequence,
+                inp.txid[::-1],
+                inp.vout.to_bytes(4, "little"),
+                script_code,
+                value.to_bytes(8, "little"),
+                inp.sequence.to_bytes(4, "little"),
+                hash_outputs,
+                tx.locktime.to_bytes(4, "little"),
+                SIGHASH.ALL.to_bytes(4, "little"),
             )
+        )
+        return _dsha256(preimage)
 
-        return final_tx
+    def sign_transaction(
+        self, tx: Transaction, prev_output: TransactionOutput
+    ) -> Transaction:
+        """Sign the P2WPKH input and attach its witness
+
+        The single input is signed directly rather than through a PSBT, which
+        avoids PSBT bookkeeping and finalize_psbt's re-parse of the whole tx.
+        The outpoint being spent is already in tx.vin[0], so only the spent
+        output (for its value) is needed.
+        """
+        midstate = self._bip143_midstate(tx)
+        sighash = self._segwit_sighash(tx, 0, prev_output.value, midstate)
+        signature = self.wallet.sign(sighash) + bytes([SIGHASH.ALL])
+        tx.vin[0].witness = script.Witness([signature, self.wallet.pub_key.sec()])
+        return tx
 
 
 def main():
@@ -466,6 +1440,9 @@ Examples:
   # Create OP_RETURN with custom data
   python main.py --data "Hello Bitcoin!"
 
+  # Batch several messages into one transaction (one OP_RETURN output each)
+  python main.py --data "first" "second" "third"
+
   # Use a custom wallet file location
   python main.py --wallet-file ~/.bitcoin-wallets/my-wallet.key --check-balance
 
@@ -492,14 +1469,15 @@ Environment Variables:
     parser.add_argument(
         "--network",
         default="test",
-        choices=["test", "main"],
+        choices=list(NETWORK_SETTINGS),
         help="Bitcoin network (default: test)",
     )
     parser.add_argument(
         "--data",
         type=str,
-        action="append",
-        help="Data to include in OP_RETURN output (can be used multiple times for multiple OP_RETURN outputs)",
+        nargs="+",
+        action="extend",
+        help="Data to include in OP_RETURN output (give several values, or repeat the flag, for one OP_RETURN output each in the same transaction)",
     )
     parser.add_argument(
         "--fee-rate",
@@ -520,11 +1498,33 @@ Environment Variables:
     parser.add_argument(
         "--utxo-index", type=int, help="Index of UTXO to use (if multiple available)"
     )
+    parser.add_argument(
+        "--sign-backend",
+        choices=SIGN_BACKENDS,
+        default="auto",
+        help="ECDSA implementation for key derivation and signing (default: auto, coincurve if installed)",
+    )
+    parser.add_argument(
+        "--utxo-cache-ttl",
+        type=float,
+        default=UTXO_CACHE_TTL,
+        help=f"Reuse a UTXO list fetched within this many seconds (default: {UTXO_CACHE_TTL})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch a fresh UTXO list instead of reusing a recent one",
+    )
     parser.add_argument(
         "--allow-large-opreturn",
         action="store_true",
         help="Allow OP_RETURN data >80 bytes (may not relay on standard nodes)",
     )
+    parser.add_argument(
+        "--datacarriersize",
+        type=int,
+        help="Reject if the OP_RETURN outputs exceed this node's -datacarriersize (total script bytes)",
+    )
     parser.add_argument(
         "--broadcast",
         action="store_true",
@@ -546,16 +1546,71 @@ Environment Variables:
     parser.add_argument(
         "--rpc-port",
         type=int,
-        help="Bitcoin Core RPC port (default: 8332 for mainnet, 18332 for testnet)",
+        help="Bitcoin Core RPC port (default: 8332 for mainnet, 18332 for testnet, 38332 for signet)",
     )
     parser.add_argument(
         "--rpc-only",
         action="store_true",
         help="Use ONLY local Bitcoin Core RPC (scantxoutset for UTXO discovery, slower but no external API)",
     )
+    parser.add_argument(
+        "--multi-broadcast",
+        action="store_true",
+        help="Broadcast to Bitcoin Core RPC and mempool.space at the same time (requires RPC credentials)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON line with the result on stdout; progress messages go to stderr",
+    )
 
     args = parser.parse_args()
 
+    with contextlib.ExitStack() as stack:
+        json_out = None
+        if args.json:
+            # Keep stdout clean for the JSON line so the tool composes in
+            # pipelines
+            json_out = sys.stdout
+            stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+        status = _run(args, json_out, stack)
+    # Outside the stack, so the session and redirect are already closed
+    if status:
+        sys.exit(status)
+
+
+def _print_reject_hint(error_msg: str) -> None:
+    """Explain common node rejection reasons for a failed broadcast"""
+    if "bad-txns-inputs-missingorspent" in error_msg:
+        print("  This usually means the UTXO was already spent")
+    elif "min relay fee" in error_msg:
+        print("  Transaction fee is too low, increase --fee-rate")
+    elif "scriptpubkey" in error_msg or "mandatory-script-verify-flag" in error_msg:
+        print("  Script validation failed - check OP_RETURN data size")
+
+
+def _write_json_result(json_out: TextIO, result: Dict) -> None:
+    """Write a --json result as a single line"""
+    json_out.write(_dump_json(result).decode() + "\n")
+    json_out.flush()
+
+
+def _fail(json_out: Optional[TextIO], error: str) -> int:
+    """Report a failed run as a --json error line and return the exit status"""
+    if json_out:
+        _write_json_result(json_out, {"error": error})
+    return 1
+
+
+def _run(
+    args: argparse.Namespace, json_out: Optional[TextIO], stack: contextlib.ExitStack
+) -> int:
+    """Run the CLI with parsed arguments, writing --json results to json_out
+
+    Resources opened along the way are registered on ``stack`` and released
+    when main() leaves it. Returns the process exit status.
+    """
+
     # Resolve wallet file path - support environment variable and expand paths
     wallet_file = os.getenv("BITCOIN_OPS_WALLET", args.wallet_file)
     wallet_file = os.path.expanduser(wallet_file)  # Expand ~ to home directory
@@ -569,18 +1624,29 @@ Environment Variables:
             print(f"✓ Created wallet directory: {wallet_dir}")
         except OSError as e:
             print(f"✗ Error creating wallet directory: {e}")
-            return
+            return _fail(json_out, f"could not create wallet directory: {e}")
 
     # Initialize wallet
-    print("=" * 80)
-    print("Bitcoin OP_RETURN Transaction Creator")
-    print("=" * 80)
+    print("\n".join([_SEP, "Bitcoin OP_RETURN Transaction Creator", _SEP]))
 
-    wallet_mgr = WalletManager(wallet_file, args.network)
+    network = NETWORK_SETTINGS[args.network]
+    if args.sign_backend == "coincurve" and coincurve is None:
+        print(
+            "\n".join(
+                [
+                    "✗ ERROR: --sign-backend coincurve needs the coincurve package",
+                    "  Install it with: uv pip install coincurve",
+                ]
+            )
+        )
+        return _fail(json_out, "--sign-backend coincurve needs the coincurve package")
+    wallet_mgr = WalletManager(wallet_file, args.network, args.sign_backend)
     priv_key, pub_key, address = wallet_mgr.load_or_generate_key()
 
-    print(f"\n{'Testnet' if args.network == 'test' else 'Mainnet'} Address: {address}")
-    print("=" * 80)
+    print("\n".join([f"\n{network.label} Address: {address}", _SEP]))
+
+    # Default RPC port for the network, unless given explicitly
+    rpc_port = args.rpc_port or network.rpc_port
 
     # Build RPC URL if credentials provided
     rpc_url = None
@@ -590,25 +1656,37 @@ Environment Variables:
         rpc_url = args.rpc_url
         use_rpc = True
     elif args.rpc_user and args.rpc_password:
-        # Default ports
-        if args.rpc_port:
-            port = args.rpc_port
-        else:
-            port = 18332 if args.network == "test" else 8332
-        rpc_url = f"http://{args.rpc_user}:{args.rpc_password}@{args.rpc_host}:{port}"
+        # Quoted so passwords containing '@', ':' or '/' survive URL parsing
+        user = quote(args.rpc_user, safe="")
+        password = quote(args.rpc_password, safe="")
+        rpc_url = f"http://{user}:{password}@{args.rpc_host}:{rpc_port}"
         use_rpc = True
 
     # Initialize UTXO manager
-    utxo_mgr = UTXOManager(
-        args.network, rpc_url=rpc_url, use_rpc=use_rpc, rpc_only=rpc_only
+    utxo_mgr = stack.enter_context(
+        UTXOManager(args.network, rpc_url=rpc_url, use_rpc=use_rpc, rpc_only=rpc_only)
     )
+    explorer_tx_url = f"{utxo_mgr.explorer_base}/tx/"
+
+    # Balance checks always ask for the current list
+    utxo_cache_ttl = 0 if args.no_cache or args.check_balance else args.utxo_cache_ttl
+    # Checked before any lookups start, so a hit doesn't waste one
+    cached_utxos = None
+    if utxo_cache_ttl > 0 and not args.history:
+        cached_utxos = utxo_mgr.read_utxo_cache(address, utxo_cache_ttl)
 
     # If using RPC, check that txindex is enabled
     if use_rpc and not rpc_only:
         print("\n⌛ Checking Bitcoin Core configuration...")
-        if not utxo_mgr.check_txindex_enabled():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if not args.history and cached_utxos is None:
+                # The mempool.space UTXO list doesn't depend on the node, so
+                # fetch it while the node answers instead of afterwards
+                utxo_mgr.prefetch_utxos_api(address, executor)
+            txindex_enabled = utxo_mgr.check_txindex_enabled()
+        if not txindex_enabled:
             utxo_mgr._print_txindex_warning()
-            return
+            return _fail(json_out, "Bitcoin Core txindex is not enabled")
         print("  ✓ txindex is enabled")
 
     # Check if history mode
@@ -616,401 +1694,598 @@ Environment Variables:
         print("\n⌛ Fetching transaction history...")
 
         try:
-            # Fetch all transactions for this address
-            if args.network == "test":
-                api_base = "https://mempool.space/testnet/api"
-            else:
-                api_base = "https://mempool.space/api"
-
-            # Get address transactions
-            tx_url = f"{api_base}/address/{address}/txs"
-            response = requests.get(tx_url, timeout=10)
-            response.raise_for_status()
-            transactions = response.json()
-
-            # Filter for transactions with OP_RETURN outputs
+            # Page through all transactions for this address, keeping only
+            # those with OP_RETURN outputs as they arrive
             op_return_txs = []
-            for tx in transactions:
-                for vout in tx.get("vout", []):
-                    if vout.get("scriptpubkey_type") == "op_return":
-                        op_return_txs.append(
-                            {
-                                "txid": tx["txid"],
-                                "status": tx.get("status", {}),
-                                "vout": vout,
-                                "fee": tx.get("fee", 0),
-                                "size": tx.get("size", 0),
-                            }
-                        )
-                        break  # Only count each tx once
+            for tx in utxo_mgr.iter_address_transactions(address):
+                # Stop at the first OP_RETURN output; each tx is counted once
+                vout = next(
+                    (
+                        v
+                        for v in tx.get("vout", ())
+                        if v.get("scriptpubkey_type") == "op_return"
+                    ),
+                    None,
+                )
+                if vout is None:
+                    continue
+                # Keep only the fields we print so the page can be freed
+                op_return_txs.append(
+                    {
+                        "txid": tx["txid"],
+                        "status": tx.get("status", {}),
+                        "scriptpubkey": vout["scriptpubkey"],
+                        "fee": tx.get("fee", 0),
+                        "size": tx.get("size", 0),
+                    }
+                )
 
             if not op_return_txs:
                 print("\n📝 No OP_RETURN transactions found for this address")
-                return
+                return 0
 
-            print(f"\n📜 Found {len(op_return_txs)} OP_RETURN transaction(s):")
-            print("=" * 80)
+            print(
+                "\n".join(
+                    [f"\n📜 Found {len(op_return_txs)} OP_RETURN transaction(s):", _SEP]
+                )
+            )
 
             for i, tx in enumerate(op_return_txs):
                 confirmed = tx["status"].get("confirmed", False)
                 block_height = tx["status"].get("block_height", "N/A")
 
-                print(f"\n[{i + 1}] TXID: {tx['txid']}")
-                print(f"    Status: {'✓ Confirmed' if confirmed else '⌛ Unconfirmed'}")
+                print(
+                    "\n".join(
+                        [
+                            f"\n[{i + 1}] TXID: {tx['txid']}",
+                            f"    Status: {'✓ Confirmed' if confirmed else '⌛ Unconfirmed'}",
+                        ]
+                    )
+                )
                 if confirmed:
                     print(f"    Block: {block_height}")
-                print(f"    Fee: {tx['fee']} sats")
-                print(f"    Size: {tx['size']} bytes")
+                print(
+                    "\n".join(
+                        [f"    Fee: {tx['fee']} sats", f"    Size: {tx['size']} bytes"]
+                    )
+                )
 
                 # Decode OP_RETURN data
-                script_hex = tx["vout"]["scriptpubkey"]
                 try:
-                    # Skip OP_RETURN opcode (6a) and get the data
-                    # Handle different push opcodes
-                    if script_hex[:2] == "6a":
-                        script_bytes = bytes.fromhex(script_hex)
-
-                        # Determine data location based on push opcode
-                        if len(script_bytes) > 1:
-                            second_byte = script_bytes[1]
-
-                            if second_byte <= 75:
-                                # Direct push (0x01-0x4b)
-                                data_start = 2
-                                data_len = second_byte
-                            elif second_byte == 0x4C:
-                                # OP_PUSHDATA1
-                                data_start = 3
-                                data_len = script_bytes[2]
-                            elif second_byte == 0x4D:
-                                # OP_PUSHDATA2
-                                data_start = 4
-                                data_len = int.from_bytes(script_bytes[2:4], "little")
-                            else:
-                                # Unknown format
-                                data_start = 2
-                                data_len = len(script_bytes) - 2
-
-                            data = script_bytes[data_start : data_start + data_len]
-
-                            # Try to decode as UTF-8
-                            try:
-                                decoded = data.decode("utf-8")
-                                print(f'    Data: "{decoded}"')
-                            except UnicodeDecodeError:
-                                print(f"    Data (hex): {data.hex()}")
-
-                            print(f"    Data length: {len(data)} bytes")
-                except Exception as e:
+                    data = _parse_op_return(bytes.fromhex(tx["scriptpubkey"]))
+
+                    # ASCII payloads (most protocol tags) skip the UTF-8 attempt
+                    if data.isascii():
+                        print(f'    Data: "{data.decode("ascii")}"')
+                    else:
+                        try:
+                            decoded = data.decode("utf-8")
+                            print(f'    Data: "{decoded}"')
+                        except UnicodeDecodeError:
+                            print(f"    Data (hex): {data.hex()}")
+
+                    print(f"    Data length: {len(data)} bytes")
+                except ValueError as e:
                     print(f"    Data: (could not decode: {e})")
 
                 # Link to view on mempool.space
-                if args.network == "test":
-                    print(f"    View: https://mempool.space/testnet/tx/{tx['txid']}")
-                else:
-                    print(f"    View: https://mempool.space/tx/{tx['txid']}")
+                print(f"    View: {explorer_tx_url}{tx['txid']}")
 
-            print("\n" + "=" * 80)
-            print(f"Total OP_RETURN transactions: {len(op_return_txs)}")
+            print(
+                "\n".join(
+                    ["\n" + _SEP, f"Total OP_RETURN transactions: {len(op_return_txs)}"]
+                )
+            )
 
         except RequestException as e:
             print(f"\n✗ Error fetching transaction history: {e}")
+            return _fail(json_out, f"could not fetch transaction history: {e}")
 
-        return
+        return 0
 
     # Fetch UTXOs
     print("\n⌛ Fetching UTXOs...")
-    utxos = utxo_mgr.fetch_utxos(address)
+    if cached_utxos is None:
+        utxos = utxo_mgr.fetch_utxos(address)
+    else:
+        utxos = cached_utxos
+    # Largest first, so --utxo-index matches the display
+    utxos.sort(key=lambda u: u["value"], reverse=True)
     utxo_mgr.display_utxos(utxos)
 
     if not utxos:
         print("\n⚠️  No funds available!")
-        print("\n📝 To get testnet coins, visit a faucet:")
-        print("   • https://testnet-faucet.mempool.co/")
-        print("   • https://coinfaucet.eu/en/btc-testnet/")
+        if network.faucets:
+            print(f"\n📝 To get {network.label.lower()} coins, visit a faucet:")
+            for faucet in network.faucets:
+                print(f"   • {faucet}")
         print(f"\n   Send coins to: {address}")
-        return
+        if args.check_balance:
+            # An empty wallet is a valid answer to a balance check
+            if json_out:
+                _write_json_result(
+                    json_out, {"address": address, "balance": 0, "utxos": 0}
+                )
+            return 0
+        return _fail(json_out, f"no funds available at {address}")
 
     # If just checking balance, exit here
     if args.check_balance:
         total = sum(u["value"] for u in utxos)
         print(f"\n💰 Total balance: {total} sats ({total / 100_000_000:.8f} BTC)")
-        return
+        if json_out:
+            _write_json_result(
+                json_out, {"address": address, "balance": total, "utxos": len(utxos)}
+            )
+        return 0
 
     # Need data to create transaction
     if not args.data:
         print(
             "\n⚠️  Use --data to specify OP_RETURN data, or --check-balance to view funds"
         )
-        return
+        return _fail(json_out, "no --data given")
+
+    builder = OPReturnTransactionBuilder(wallet_mgr, fee_rate=args.fee_rate)
+
+    # Convert all data strings to bytes
+    op_return_data_list = [d.encode("utf-8") for d in args.data]
 
     # Select UTXO
     if args.utxo_index is not None:
         if args.utxo_index >= len(utxos):
             print(f"✗ Invalid UTXO index. Available: 0-{len(utxos) - 1}")
-            return
-        selected_utxo = utxos[args.utxo_index]
+            return _fail(json_out, f"invalid --utxo-index {args.utxo_index}")
+        selected_utxo = SelectedUtxo.from_record(utxos[args.utxo_index])
     else:
-        # Use first (largest) UTXO
-        selected_utxo = utxos[0]
+        # Smallest UTXO that pays the fee and still leaves non-dust change
+        target = builder.estimate_fee(op_return_data_list) + DUST_LIMIT
+        selected_utxo = SelectedUtxo.from_record(select_utxo(utxos, target))
 
-    print(f"\n✓ Using UTXO: {selected_utxo['txid']}:{selected_utxo['vout']}")
-    print(f"  Amount: {selected_utxo['value']} sats")
+    print(
+        "\n".join(
+            [
+                f"\n✓ Using UTXO: {selected_utxo.txid}:{selected_utxo.vout}",
+                f"  Amount: {selected_utxo.value} sats",
+            ]
+        )
+    )
 
-    # Fetch previous transaction
-    print("\n⌛ Fetching previous transaction...")
-    prev_tx = utxo_mgr.fetch_transaction(selected_utxo["txid"])
-    if not prev_tx:
-        print("✗ Failed to fetch previous transaction")
-        return
+    # P2WPKH signing only needs the spent output's value and script, both of
+    # which we already know, so there's no need to fetch the previous tx
+    prev_output = TransactionOutput(
+        value=selected_utxo.value, script_pubkey=wallet_mgr.script_pubkey
+    )
 
     # Build and sign transaction
     print("\n⌛ Building transaction...")
-    builder = OPReturnTransactionBuilder(wallet_mgr, fee_rate=args.fee_rate)
-
-    # Convert all data strings to bytes
-    op_return_data_list = [d.encode("utf-8") for d in args.data]
 
     # Display all OP_RETURN data
     print(
         f"✓ Creating transaction with {len(op_return_data_list)} OP_RETURN output(s):"
     )
+    # Sizes gathered in the display pass drive all the limit checks below
     total_data_size = 0
+    total_script_size = 0
+    max_data_size = 0
     for i, data in enumerate(op_return_data_list):
-        print(f'  [{i + 1}] Data: "{args.data[i]}"')
-        print(f"      Bytes: {data.hex()}")
-        print(f"      Length: {len(data)} bytes")
-        total_data_size += len(data)
+        size = len(data)
+        print(
+            "\n".join(
+                [
+                    f'  [{i + 1}] Data: "{args.data[i]}"',
+                    f"      Bytes: {data.hex()}",
+                    f"      Length: {size} bytes",
+                ]
+            )
+        )
+        total_data_size += size
+        # OP_RETURN + push opcode(s) + data, as -datacarriersize counts it
+        total_script_size += _op_return_script_size(size)
+        max_data_size = max(max_data_size, size)
 
     print(f"\n  Total OP_RETURN data size: {total_data_size} bytes")
 
     # Warn about multiple OP_RETURN outputs
     if len(op_return_data_list) > 1:
         print(
-            f"\n⚠️  WARNING: Transaction has {len(op_return_data_list)} OP_RETURN outputs"
+            "\n".join(
+                [
+                    f"\n⚠️  WARNING: Transaction has {len(op_return_data_list)} OP_RETURN outputs",
+                    "  Bitcoin Core's default policy rejects multiple OP_RETURN outputs (multi-op-return)",
+                    "  This is a STANDARDNESS rule, not a consensus rule.",
+                    "\n  This transaction will NOT propagate on the standard network!",
+                    "\n  To broadcast, you need a custom Bitcoin Core node with:",
+                    "    -datacarriersize=<size>  (for total data size)",
+                    "    -permitbaremultisig=1    (allows multiple OP_RETURN)",
+                    "\n  Note: Most explorers and nodes will reject this transaction.",
+                ]
+            )
         )
+
+    # Check size limits, hardest limit first
+    if max_data_size > 10000:
         print(
-            "  Bitcoin Core's default policy rejects multiple OP_RETURN outputs (multi-op-return)"
+            "\n".join(
+                [
+                    f"\n✗ ERROR: OP_RETURN data is too large ({max_data_size} bytes)",
+                    "  Maximum reasonable size is around 10KB",
+                ]
+            )
         )
-        print("  This is a STANDARDNESS rule, not a consensus rule.")
-        print("\n  This transaction will NOT propagate on the standard network!")
-        print("\n  To broadcast, you need a custom Bitcoin Core node with:")
-        print("    -datacarriersize=<size>  (for total data size)")
-        print("    -permitbaremultisig=1    (allows multiple OP_RETURN)")
-        print("\n  Note: Most explorers and nodes will reject this transaction.")
-
-    # Check size limits for each OP_RETURN
-    max_data_size = max(len(d) for d in op_return_data_list)
-    if max_data_size > 80 and not args.allow_large_opreturn:
+        return _fail(json_out, f"OP_RETURN data is too large ({max_data_size} bytes)")
+
+    if args.datacarriersize is not None and total_script_size > args.datacarriersize:
         print(
-            f"\n✗ ERROR: One or more OP_RETURN outputs exceed 80 bytes (largest: {max_data_size} bytes)"
+            "\n".join(
+                [
+                    f"\n✗ ERROR: OP_RETURN outputs total {total_script_size} script bytes, "
+                    f"over -datacarriersize={args.datacarriersize}",
+                    "  The target node will reject this transaction",
+                ]
+            )
         )
-        print(
-            "\n  Bitcoin Core's default policy (-datacarriersize=80) rejects OP_RETURN >80 bytes"
+        return _fail(
+            json_out,
+            f"OP_RETURN outputs total {total_script_size} script bytes, "
+            f"over -datacarriersize={args.datacarriersize}",
         )
+
+    if max_data_size > 80 and not args.allow_large_opreturn:
         print(
-            "  Most nodes and services (including mempool.space) won't relay these transactions"
+            "\n".join(
+                [
+                    f"\n✗ ERROR: One or more OP_RETURN outputs exceed 80 bytes (largest: {max_data_size} bytes)",
+                    "\n  Bitcoin Core's default policy (-datacarriersize=80) rejects OP_RETURN >80 bytes",
+                    "  Most nodes and services (including mempool.space) won't relay these transactions",
+                    "\n  Solutions:",
+                    "    1. Shorten your messages to ≤80 bytes each",
+                    "    2. Use --allow-large-opreturn flag (transaction may not broadcast)",
+                    "    3. Broadcast to a node with higher -datacarriersize setting",
+                ]
+            )
+        )
+        return _fail(
+            json_out,
+            f"OP_RETURN data exceeds 80 bytes ({max_data_size} bytes); "
+            "use --allow-large-opreturn",
         )
-        print("\n  Solutions:")
-        print("    1. Shorten your messages to ≤80 bytes each")
-        print("    2. Use --allow-large-opreturn flag (transaction may not broadcast)")
-        print("    3. Broadcast to a node with higher -datacarriersize setting")
-        return
 
     if max_data_size > 80:
         print(
-            f"⚠️  WARNING: One or more OP_RETURN outputs exceed 80 bytes (largest: {max_data_size} bytes)"
-        )
-        print("  This transaction likely won't relay on standard nodes!")
-        print(
-            f"  You'll need to broadcast to a custom node with -datacarriersize={max_data_size} or higher"
+            "\n".join(
+                [
+                    f"⚠️  WARNING: One or more OP_RETURN outputs exceed 80 bytes (largest: {max_data_size} bytes)",
+                    "  This transaction likely won't relay on standard nodes!",
+                    f"  You'll need to broadcast to a custom node with -datacarriersize={total_script_size} or higher",
+                ]
+            )
         )
 
-    if max_data_size > 10000:
-        print(f"\n✗ ERROR: OP_RETURN data is too large ({max_data_size} bytes)")
-        print("  Maximum reasonable size is around 10KB")
-        return
+    # Confirm mainnet broadcasts up front, so a cancel skips signing entirely
+    use_rpc_broadcast = args.rpc_url or args.rpc_user
+    if network.is_mainnet and (
+        args.multi_broadcast
+        or (
+            args.broadcast
+            and not use_rpc_broadcast
+            and (not args.allow_large_opreturn or max_data_size <= 80)
+        )
+    ):
+        print("⚠️  WARNING: This will broadcast to MAINNET (real Bitcoin)!")
+        confirm = input("Type 'yes' to confirm: ")
+        if confirm.lower() != "yes":
+            print("Broadcast cancelled")
+            return _fail(json_out, "broadcast cancelled")
 
     tx = builder.create_transaction(
-        selected_utxo["txid"],
-        selected_utxo["vout"],
-        selected_utxo["value"],
+        selected_utxo.txid_bytes,
+        selected_utxo.vout,
+        selected_utxo.value,
         op_return_data_list,
-        prev_tx,
     )
 
     print("⌛ Signing transaction...")
-    final_tx = builder.sign_transaction(
-        tx,
-        selected_utxo["txid"],
-        selected_utxo["vout"],
-        prev_tx.vout[selected_utxo["vout"]],
-    )
+    final_tx = builder.sign_transaction(tx, prev_output)
 
-    print("\n" + "=" * 80)
-    print("✓ Transaction created successfully!")
-    print("=" * 80)
+    print("\n".join(["\n" + _SEP, "✓ Transaction created successfully!", _SEP]))
 
-    tx_hex = final_tx.to_string()
-    print(f"\nTransaction Hex:\n{tx_hex}")
-    print("\n" + "=" * 80)
+    # Hex-encode once; the bytes are the mempool.space body, the str goes
+    # into JSON-RPC payloads and the printout
+    tx_hex_bytes = binascii.hexlify(final_tx.serialize())
+    tx_hex = tx_hex_bytes.decode("ascii")
+    # Written in pieces so a large hex isn't copied into another f-string
+    sys.stdout.write("\nTransaction Hex:\n")
+    sys.stdout.write(tx_hex)
+    sys.stdout.write("\n")
+    print("\n" + _SEP)
 
     # Broadcast if requested
-    if args.broadcast or args.rpc_url or args.rpc_user:
-        # Determine broadcast method
-        use_rpc = args.rpc_url or args.rpc_user
-
-        if use_rpc:
-            # Broadcast to local Bitcoin Core node via RPC
-            print("\n⌛ Broadcasting transaction to Bitcoin Core RPC...")
-
-            # Build RPC URL
-            if args.rpc_url:
-                rpc_url = args.rpc_url
+    broadcast_requested = bool(
+        args.broadcast or args.rpc_url or args.rpc_user or args.multi_broadcast
+    )
+    txid: Optional[str] = None
+    broadcast_error: Optional[str] = None
+    if broadcast_requested:
+        # The selected UTXO is about to be spent, so don't offer it again
+        utxo_mgr.invalidate_utxo_cache(address)
+
+        if args.multi_broadcast:
+            # Send to every endpoint at once and take the first to accept
+            if not utxo_mgr.rpc:
+                print(
+                    "\n".join(
+                        [
+                            "✗ ERROR: --multi-broadcast needs Bitcoin Core RPC access",
+                            "  Use --rpc-user and --rpc-password, or provide full --rpc-url",
+                        ]
+                    )
+                )
+                broadcast_error = "--multi-broadcast needs Bitcoin Core RPC access"
             else:
-                # Construct from components
-                if not args.rpc_user or not args.rpc_password:
-                    print("✗ ERROR: RPC user and password required")
+                print(
+                    "\n⌛ Broadcasting transaction to Bitcoin Core RPC and mempool.space..."
+                )
+                # Daemon threads, so the process can exit as soon as one
+                # endpoint accepts instead of waiting for the slower one.
+                # Each gets its own session: the loser may still be using it
+                # after main() has closed the shared one.
+                answers: queue.Queue = queue.Queue()
+
+                def broadcast(name: str, send, payload) -> None:
+                    with utxo_mgr.new_session() as session:
+                        try:
+                            answers.put((name, send(payload, session=session), None))
+                        except (RequestException, RuntimeError) as e:
+                            answers.put((name, None, e))
+
+                endpoints = [
+                    ("Bitcoin Core RPC", utxo_mgr.send_transaction_rpc, tx_hex),
+                    ("mempool.space", utxo_mgr.send_transaction_api, tx_hex_bytes),
+                ]
+                for endpoint in endpoints:
+                    threading.Thread(
+                        target=broadcast, args=endpoint, daemon=True
+                    ).start()
+                for _ in endpoints:
+                    name, sent_txid, error = answers.get()
+                    if error is not None:
+                        print(f"  ✗ {name}: {error}")
+                        broadcast_error = f"{name}: {error}"
+                        continue
+                    # The slower endpoint will only report the tx as known
+                    txid = sent_txid
                     print(
-                        "  Use --rpc-user and --rpc-password, or provide full --rpc-url"
+                        "\n".join(
+                            [
+                                f"\n✓ Transaction broadcast successful via {name}!",
+                                f"  TXID: {txid}",
+                            ]
+                        )
                     )
-                    return
+                    break
 
-                # Default ports
-                if args.rpc_port:
-                    port = args.rpc_port
+                if txid is None:
+                    print("\n✗ Broadcast failed on every endpoint!")
+                    # Report the last endpoint's error; each one was printed above
+                    broadcast_error = broadcast_error or "broadcast failed"
                 else:
-                    port = 18332 if args.network == "test" else 8332
+                    print(
+                        "\n".join(
+                            ["\n  View on mempool.space:", f"  {explorer_tx_url}{txid}"]
+                        )
+                    )
 
-                rpc_url = (
-                    f"http://{args.rpc_user}:{args.rpc_password}@{args.rpc_host}:{port}"
-                )
+        elif use_rpc_broadcast:
+            # Broadcast to local Bitcoin Core node via RPC
+            print("\n⌛ Broadcasting transaction to Bitcoin Core RPC...")
 
-            try:
-                # Make RPC call to sendrawtransaction
-                rpc_payload = {
-                    "jsonrpc": "1.0",
-                    "id": "bitcoin-ops",
-                    "method": "sendrawtransaction",
-                    "params": [tx_hex],
-                }
+            # Same endpoint the UTXO lookups used
+            rpc = utxo_mgr.rpc
+            if not rpc:
+                print(
+                    "\n".join(
+                        [
+                            "✗ ERROR: RPC user and password required",
+                            "  Use --rpc-user and --rpc-password, or provide full --rpc-url",
+                        ]
+                    )
+                )
+                broadcast_error = "RPC user and password required"
+            else:
+                try:
+                    # Validate and send in one round-trip; bitcoind runs batch
+                    # entries in order, so testmempoolaccept sees the tx first and
+                    # explains a rejection better than sendrawtransaction's error
+                    rpc_payload = rpc.batch_payload(
+                        [
+                            ("testmempoolaccept", [[tx_hex]]),
+                            ("sendrawtransaction", [tx_hex]),
+                        ]
+                    )
 
-                response = requests.post(rpc_url, json=rpc_payload, timeout=10)
+                    response = utxo_mgr.session.post(
+                        rpc.url,
+                        data=_dump_json(rpc_payload),
+                        headers=rpc.headers,
+                        timeout=(RPC_CONNECT_TIMEOUT, 10),
+                    )
 
-                if response.status_code == 200:
-                    result = response.json()
-
-                    if "error" in result and result["error"]:
-                        print(f"\n✗ RPC error: {result['error']}")
-
-                        # Provide helpful error messages
-                        error_msg = str(result["error"])
-                        if "bad-txns-inputs-missingorspent" in error_msg:
-                            print("  This usually means the UTXO was already spent")
-                        elif "min relay fee" in error_msg:
-                            print("  Transaction fee is too low, increase --fee-rate")
-                        elif (
-                            "scriptpubkey" in error_msg
-                            or "mandatory-script-verify-flag" in error_msg
-                        ):
+                    batch = None
+                    if response.status_code == 200:
+                        with contextlib.suppress(ValueError):
+                            batch = _parse_json(response)
+                    # Anything but our two answers, keyed by id, means the batch
+                    # wasn't understood (some RPC proxies reject batches)
+                    if not (
+                        isinstance(batch, list)
+                        and len(batch) == 2
+                        and all(isinstance(entry, dict) for entry in batch)
+                        and {entry.get("id") for entry in batch} == {0, 1}
+                    ):
+                        batch = None
+
+                    if batch is None:
+                        # Fall back to a plain sendrawtransaction
+                        try:
+                            txid = utxo_mgr.send_transaction_rpc(tx_hex)
+                        except RuntimeError as e:
+                            broadcast_error = str(e)
                             print(
-                                "  Script validation failed - check OP_RETURN data size"
+                                "\n".join(
+                                    [f"\n✗ RPC error: {e}", f"  URL: {rpc.safe_url}"]
+                                )
+                            )
+                            _print_reject_hint(str(e))
+                        else:
+                            print(
+                                "\n".join(
+                                    [
+                                        "\n✓ Transaction broadcast successful via RPC!",
+                                        f"  TXID: {txid}",
+                                        "\n  View on mempool.space:",
+                                        f"  {explorer_tx_url}{txid}",
+                                    ]
+                                )
                             )
                     else:
-                        txid = result.get("result", "")
-                        print("\n✓ Transaction broadcast successful via RPC!")
-                        print(f"  TXID: {txid}")
-
-                        if args.network == "test":
-                            print("\n  View on mempool.space:")
-                            print(f"  https://mempool.space/testnet/tx/{txid}")
+                        accept, result = sorted(batch, key=lambda entry: entry["id"])
+
+                        if result.get("error"):
+                            print(f"\n✗ RPC error: {result['error']}")
+
+                            # Provide helpful error messages
+                            error_msg = str(result["error"])
+                            accept_result = accept.get("result") or [{}]
+                            reject_reason = accept_result[0].get("reject-reason")
+                            if reject_reason:
+                                print(
+                                    f"  Mempool rejected the transaction: {reject_reason}"
+                                )
+                                error_msg = f"{error_msg} {reject_reason}"
+                            broadcast_error = error_msg
+                            _print_reject_hint(error_msg)
                         else:
-                            print("\n  View on mempool.space:")
-                            print(f"  https://mempool.space/tx/{txid}")
-                else:
-                    print("\n✗ RPC request failed!")
-                    print(f"  Status code: {response.status_code}")
-                    print(f"  Response: {response.text}")
+                            txid = result.get("result", "")
+                            print(
+                                "\n".join(
+                                    [
+                                        "\n✓ Transaction broadcast successful via RPC!",
+                                        f"  TXID: {txid}",
+                                        "\n  View on mempool.space:",
+                                        f"  {explorer_tx_url}{txid}",
+                                    ]
+                                )
+                            )
 
-            except RequestsConnectionError:
-                print("\n✗ Connection error: Could not connect to Bitcoin Core RPC")
-                print(
-                    f"  URL: {rpc_url.replace(args.rpc_password if args.rpc_password else '', '****') if args.rpc_password else rpc_url}"
-                )
-                print("\n  Make sure:")
-                print("    1. Bitcoin Core is running")
-                print("    2. RPC server is enabled (server=1 in bitcoin.conf)")
-                print("    3. Credentials are correct")
-                print(
-                    f"    4. RPC port is correct ({port if 'port' in locals() else 'check your config'})"
-                )
+                except RequestsConnectionError:
+                    broadcast_error = "Could not connect to Bitcoin Core RPC"
+                    print(
+                        "\n".join(
+                            [
+                                "\n✗ Connection error: Could not connect to Bitcoin Core RPC",
+                                f"  URL: {rpc.safe_url}",
+                                "\n  Make sure:",
+                                "    1. Bitcoin Core is running",
+                                "    2. RPC server is enabled (server=1 in bitcoin.conf)",
+                                "    3. Credentials are correct",
+                                f"    4. RPC port is correct ({rpc.port or 'check your config'})",
+                            ]
+                        )
+                    )
 
-            except RequestException as e:
-                print(f"\n✗ Network error during RPC broadcast: {e}")
+                except RequestException as e:
+                    broadcast_error = str(e)
+                    print(
+                        "\n".join(
+                            [
+                                f"\n✗ Network error during RPC broadcast: {e}",
+                                f"  URL: {rpc.safe_url}",
+                            ]
+                        )
+                    )
 
         else:
             # Broadcast to mempool.space
             print("\n⌛ Broadcasting transaction to mempool.space...")
 
-            if args.network == "test":
-                broadcast_url = "https://mempool.space/testnet/api/tx"
-            else:
-                broadcast_url = "https://mempool.space/api/tx"
-                if not args.allow_large_opreturn or max_data_size <= 80:
-                    # Extra confirmation for mainnet
-                    print("⚠️  WARNING: This will broadcast to MAINNET (real Bitcoin)!")
-                    confirm = input("Type 'yes' to confirm: ")
-                    if confirm.lower() != "yes":
-                        print("Broadcast cancelled")
-                        return
-
             try:
-                response = requests.post(broadcast_url, data=tx_hex, timeout=10)
+                # Reuses the keep-alive connection from the UTXO fetch
+                response = utxo_mgr.session.post(
+                    f"{utxo_mgr.api_base}/tx", data=tx_hex_bytes, timeout=10
+                )
 
                 if response.status_code == 200:
                     txid = response.text.strip()
-                    print("\n✓ Transaction broadcast successful!")
-                    print(f"  TXID: {txid}")
-
-                    if args.network == "test":
-                        print("\n  View on mempool.space:")
-                        print(f"  https://mempool.space/testnet/tx/{txid}")
-                    else:
-                        print("\n  View on mempool.space:")
-                        print(f"  https://mempool.space/tx/{txid}")
+                    print(
+                        "\n".join(
+                            [
+                                "\n✓ Transaction broadcast successful!",
+                                f"  TXID: {txid}",
+                                "\n  View on mempool.space:",
+                                f"  {explorer_tx_url}{txid}",
+                            ]
+                        )
+                    )
                 else:
-                    print("\n✗ Broadcast failed!")
-                    print(f"  Status code: {response.status_code}")
-                    print(f"  Response: {response.text}")
-
-                    # Try to parse error message
-                    try:
-                        error_msg = response.text
-                        if "scriptpubkey" in error_msg.lower():
-                            print(
-                                "\n  This error usually means the OP_RETURN data is too large (>80 bytes)"
+                    broadcast_error = (
+                        response.text.strip() or f"HTTP {response.status_code}"
+                    )
+                    print(
+                        "\n".join(
+                            [
+                                "\n✗ Broadcast failed!",
+                                f"  Status code: {response.status_code}",
+                                f"  Response: {response.text}",
+                            ]
+                        )
+                    )
+
+                    # mempool.space relays the node's reject reason as text
+                    if "scriptpubkey" in response.text.lower():
+                        print(
+                            "\n".join(
+                                [
+                                    "\n  This error usually means the OP_RETURN data is too large (>80 bytes)",
+                                    f"  Largest OP_RETURN is {max_data_size} bytes",
+                                ]
                             )
-                            print(f"  Largest OP_RETURN is {max_data_size} bytes")
-                    except Exception:
-                        pass
+                        )
 
             except RequestException as e:
+                broadcast_error = str(e)
                 print(f"\n✗ Network error during broadcast: {e}")
     else:
         # Show manual broadcast instructions
-        if args.network == "test":
-            print("\n📡 Broadcast options:")
-            print("   • Run with --broadcast flag to use mempool.space")
-            print("   • Run with --rpc-user/--rpc-password to use local Bitcoin Core")
-            print(
-                "   • Or manually paste hex at: https://mempool.space/testnet/tx/push"
-            )
-        else:
+        if network.is_mainnet:
             print("\n⚠️  MAINNET TRANSACTION - Verify carefully before broadcasting!")
-            print("\n📡 Broadcast options:")
-            print("   • Run with --broadcast flag to use mempool.space")
-            print("   • Run with --rpc-user/--rpc-password to use local Bitcoin Core")
-            print("   • Or manually paste hex at: https://mempool.space/tx/push")
+        print(
+            "\n".join(
+                [
+                    "\n📡 Broadcast options:",
+                    "   • Run with --broadcast flag to use mempool.space",
+                    "   • Run with --rpc-user/--rpc-password to use local Bitcoin Core",
+                    f"   • Or manually paste hex at: {explorer_tx_url}push",
+                ]
+            )
+        )
+
+    if json_out:
+        # Written after broadcasting so callers see whether it went through
+        result = {
+            "txid": final_tx.txid().hex(),
+            "tx_hex": tx_hex,
+            "fee": selected_utxo.value - sum(out.value for out in final_tx.vout),
+        }
+        if broadcast_requested:
+            result["broadcast"] = {
+                "ok": txid is not None,
+                "txid": txid,
+                "error": None if txid is not None else broadcast_error,
+            }
+        _write_json_result(json_out, result)
+
+    return 1 if broadcast_requested and txid is None else 0
 
 
 if __name__ == "__main__":